@@ -206,7 +206,7 @@ def check_params(params, count, string):
     # All parameters used in the reference are expected to be included.
     # Warn if this isn't the case.
     for order in params:
-        if order not in sorted(lparams):
+        if order not in lparams:
             has_errors = True
             yield (
                 "warning",
@@ -107,62 +107,42 @@ class GenericL10nChecks:
     """Helper Mixin for checks shared between Terms and Messages."""
 
     def check_duplicate_attributes(self, node):
-        warned = set()
-        for left in range(len(node.attributes) - 1):
-            if left in warned:
-                continue
-            left_attr = node.attributes[left]
-            warned_left = False
-            for right in range(left + 1, len(node.attributes)):
-                right_attr = node.attributes[right]
-                if left_attr.id.name == right_attr.id.name:
-                    if not warned_left:
-                        warned_left = True
-                        self.messages.append(
-                            (
-                                "warning",
-                                left_attr.span.start,
-                                MSGS["duplicate-attribute"].format(
-                                    name=left_attr.id.name
-                                ),
-                            )
-                        )
-                    warned.add(right)
+        if len(node.attributes) < 2:
+            # no duplicates possible
+            return
+        # Group attribute positions by name, in one pass over the attributes.
+        positions = {}
+        for attr in node.attributes:
+            positions.setdefault(attr.id.name, []).append(attr.span.start)
+        for name, starts in positions.items():
+            if len(starts) > 1:
+                for start in starts:
                     self.messages.append(
                         (
                             "warning",
-                            right_attr.span.start,
-                            MSGS["duplicate-attribute"].format(name=left_attr.id.name),
+                            start,
+                            MSGS["duplicate-attribute"].format(name=name),
                         )
                     )
 
     def check_variants(self, variants):
-        # Check for duplicate variants
-        warned = set()
-        for left in range(len(variants) - 1):
-            if left in warned:
-                continue
-            left_key = variants[left].key
-            key_string = None
-            for right in range(left + 1, len(variants)):
-                if left_key.equals(variants[right].key):
-                    if key_string is None:
-                        key_string = serialize_variant_key(left_key)
+        # Check for duplicate variants. Variant keys are identifiers or
+        # number literals, so their serialization identifies them.
+        keys = {}
+        for variant in variants:
+            keys.setdefault(serialize_variant_key(variant.key), []).append(variant.key)
+        if len(keys) < len(variants):
+            # at least one of the groups has duplicates
+            for key_string, variant_keys in keys.items():
+                if len(variant_keys) > 1:
+                    for key in variant_keys:
                         self.messages.append(
                             (
                                 "warning",
-                                left_key.span.start,
+                                key.span.start,
                                 MSGS["duplicate-variant"].format(name=key_string),
                             )
                         )
-                    warned.add(right)
-                    self.messages.append(
-                        (
-                            "warning",
-                            variants[right].key.span.start,
-                            MSGS["duplicate-variant"].format(name=key_string),
-                        )
-                    )
         # Check for plural categories
         known_plurals = plurals.get_plural(self.locale)
         if known_plurals:
@@ -171,7 +151,7 @@ class GenericL10nChecks:
             # `other` is used for all kinds of things.
             check_plurals = known_plurals.copy()
             check_plurals.discard("other")
-            given_plurals = {serialize_variant_key(v.key) for v in variants}
+            given_plurals = set(keys)
             if given_plurals & check_plurals:
                 missing_plurals = sorted(known_plurals - given_plurals)
                 if missing_plurals:
@@ -241,6 +221,9 @@ class L10nMessageVisitor(GenericL10nChecks, ReferenceMessageVisitor):
             # Reference is complex, l10n isn't.
             # Let's still validate the css spec.
             ref_styles = {}
+        else:
+            # check_style consumes the map, keep the reference data intact
+            ref_styles = dict(ref_styles)
         for cat, msg, pos, _ in self.check_style(
             ref_styles, self.css_styles, self.css_errors
         ):
@@ -303,10 +286,16 @@ class FluentChecker(Checker):
 
     pattern = re.compile(r".*\.ftl")
 
-    def check_message(self, ref_entry, l10n_entry):
+    def check_message(self, refEnt, l10n_entry):
         """Run checks on localized messages against reference message."""
-        ref_data = ReferenceMessageVisitor()
-        ref_data.visit(ref_entry)
+        # Traversing the reference message only depends on the reference,
+        # cache the result on the entity in case we see it again. Don't
+        # cache on the AST node itself, that would break its equals().
+        ref_data = getattr(refEnt, "_ref_data_cache", None)
+        if ref_data is None:
+            ref_data = ReferenceMessageVisitor()
+            ref_data.visit(refEnt.entry)
+            refEnt._ref_data_cache = ref_data
         l10n_data = L10nMessageVisitor(self.locale, ref_data)
         l10n_data.visit(l10n_entry)
 
@@ -328,8 +317,7 @@ class FluentChecker(Checker):
         yield from super().check(refEnt, l10nEnt)
         l10n_entry = l10nEnt.entry
         if isinstance(l10n_entry, ftl.Message):
-            ref_entry = refEnt.entry
-            messages = self.check_message(ref_entry, l10n_entry)
+            messages = self.check_message(refEnt, l10n_entry)
         elif isinstance(l10n_entry, ftl.Term):
             messages = self.check_term(l10n_entry)
 
@@ -27,6 +27,8 @@ class PropertiesChecker(Checker):
         r"(?P<prec>\.(?:\*|[0-9]+)?)?"
         r"(?P<spec>[duxXosScpfg]))?"
     )
+    just_number = re.compile(r"\d+$")
+    plural_variable = re.compile("#([0-9]+)")
 
     def check(self, refEnt, l10nEnt):
         """Test for the different variable formats."""
@@ -41,7 +43,7 @@ class PropertiesChecker(Checker):
             refEnt.pre_comment
             and "Localization_and_Plurals" in refEnt.pre_comment.all
             and refEnt.key != "pluralRule"
-            and not re.match(r"\d+$", refValue)
+            and not self.just_number.match(refValue)
         ):
             yield from self.check_plural(refValue, l10nValue)
             return
@@ -79,10 +81,10 @@ class PropertiesChecker(Checker):
                 yield ("warning", 0, msg, "plural")
             if expected_forms < found_forms:
                 yield ("warning", 0, msg, "plural")
-        pats = {int(m.group(1)) for m in re.finditer("#([0-9]+)", refValue)}
+        pats = {int(m.group(1)) for m in self.plural_variable.finditer(refValue)}
         if len(pats) == 0:
             return
-        lpats = {int(m.group(1)) for m in re.finditer("#([0-9]+)", l10nValue)}
+        lpats = {int(m.group(1)) for m in self.plural_variable.finditer(l10nValue)}
         if pats - lpats:
             yield ("warning", 0, "not all variables used in l10n", "plural")
             return
@@ -131,6 +131,16 @@ class ObserverList(Observer):
             observer.updateStats(file, stats)
         super().updateStats(file, stats)
 
+    # How to render a detail item per category, in order of precedence.
+    detail_templates = (
+        ("error", "ERROR: {}"),
+        ("warning", "WARNING: {}"),
+        ("missingEntity", "+{}"),
+        ("obsoleteEntity", "-{}"),
+        ("missingFile", "// add and localize this file"),
+        ("obsoleteFile", "// remove this file"),
+    )
+
     def serializeDetails(self):
         def tostr(t):
             if t[1] == "key":
@@ -138,18 +148,10 @@ class ObserverList(Observer):
             o = []
             indent = "  " * (t[0] + 1)
             for item in t[2]:
-                if "error" in item:
-                    o += [indent + "ERROR: " + item["error"]]
-                elif "warning" in item:
-                    o += [indent + "WARNING: " + item["warning"]]
-                elif "missingEntity" in item:
-                    o += [indent + "+" + item["missingEntity"]]
-                elif "obsoleteEntity" in item:
-                    o += [indent + "-" + item["obsoleteEntity"]]
-                elif "missingFile" in item:
-                    o.append(indent + "// add and localize this file")
-                elif "obsoleteFile" in item:
-                    o.append(indent + "// remove this file")
+                for category, template in self.detail_templates:
+                    if category in item:
+                        o.append(indent + template.format(item[category]))
+                        break
             return "\n".join(o)
 
         return "\n".join(tostr(c) for c in self.details.getContent())
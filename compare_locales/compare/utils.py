@@ -102,12 +102,12 @@ class AddRemove:
 
     def set_left(self, left):
         if not isinstance(left, list):
-            left = list(li for li in left)
+            left = list(left)
         self.left = left
 
     def set_right(self, right):
         if not isinstance(right, list):
-            right = list(li for li in right)
+            right = list(right)
         self.right = right
 
     def __iter__(self):
@@ -17,7 +17,6 @@ to newest instead.
 
 from collections import OrderedDict, defaultdict
 from codecs import encode
-from functools import reduce
 
 
 from compare_locales import parser as cl
@@ -55,28 +54,28 @@ def merge_resources(parser, resources, keep_newest=True):
         if isinstance(resource, bytes):
             parser.readContents(resource)
             resource = parser.walk()
-        pairs = [get_key_value(entity, counter) for entity in resource]
-        return OrderedDict(pairs)
+        return OrderedDict(get_key_value(entity, counter) for entity in resource)
 
     def get_key_value(entity, counter):
+        # Entities and Junk are the common case, check for them first.
+        if not isinstance(entity, (cl.Comment, cl.Whitespace)):
+            return (entity.key, entity)
+
         if isinstance(entity, cl.Comment):
             counter[entity.val] += 1
             # Use the (value, index) tuple as the key. AddRemove will
             # de-deplicate identical comments at the same index.
             return ((entity.val, counter[entity.val]), entity)
 
-        if isinstance(entity, cl.Whitespace):
-            # Use the Whitespace instance as the key so that it's always
-            # unique. Adjecent whitespace will be folded into the longer one in
-            # prune.
-            return (entity, entity)
-
-        return (entity.key, entity)
+        # Use the Whitespace instance as the key so that it's always
+        # unique. Adjecent whitespace will be folded into the longer one in
+        # prune.
+        return (entity, entity)
 
-    entities = reduce(
-        lambda x, y: merge_two(x, y, keep_newer=keep_newest),
-        map(parse_resource, resources),
-    )
+    resources = iter(resources)
+    entities = parse_resource(next(resources))
+    for resource in resources:
+        entities = merge_two(entities, parse_resource(resource), keep_newer=keep_newest)
     return entities.values()
 
 
@@ -96,25 +95,23 @@ def merge_two(newer, older, keep_newer=True):
     get_entity = get_newer_entity if keep_newer else get_older_entity
     contents = [(key, get_entity(newer, older, key)) for _, key in diff]
 
-    def prune(acc, cur):
+    pruned = []
+    for cur in contents:
         _, entity = cur
         if entity is None:
             # Prune Nones which stand for duplicated comments.
-            return acc
+            continue
 
-        if len(acc) and isinstance(entity, cl.Whitespace):
-            _, prev_entity = acc[-1]
+        if pruned and isinstance(entity, cl.Whitespace):
+            _, prev_entity = pruned[-1]
 
             if isinstance(prev_entity, cl.Whitespace):
                 # Prefer the longer whitespace.
                 if len(entity.all) > len(prev_entity.all):
-                    acc[-1] = (entity, entity)
-                return acc
-
-        acc.append(cur)
-        return acc
+                    pruned[-1] = (entity, entity)
+                continue
 
-    pruned = reduce(prune, contents, [])
+        pruned.append(cur)
     return OrderedDict(pruned)
 
 
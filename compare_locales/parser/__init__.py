@@ -3,6 +3,7 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 import re
+from functools import lru_cache
 
 from .base import (
     CAN_NONE,
@@ -68,7 +69,12 @@ __all__ = [
 __constructors = []
 
 
+@lru_cache(maxsize=None)
 def getParser(path):
+    # The dispatch only depends on the path, and the parsers are
+    # shared instances anyway, so cache the lookup. In particular the
+    # entry-point scan for third-party parsers is too slow to redo for
+    # every file.
     for item in __constructors:
         if re.search(item[0], path):
             return item[1]
@@ -42,6 +42,8 @@ class AndroidEntity(Entity):
 
     @property
     def all(self):
+        if self.pre_comment is None and self.inner_white is None:
+            return self._all_literal
         chunks = []
         if self.pre_comment is not None:
             chunks.append(self.pre_comment.all)
@@ -73,13 +75,12 @@ class AndroidEntity(Entity):
                 if child.nodeType == Node.CDATA_SECTION_NODE:
                     break
         child.data = raw_val
-        all = []
-        if self.pre_comment is not None:
-            all.append(self.pre_comment.all)
+        all = clone.toxml()
         if self.inner_white is not None:
-            all.append(self.inner_white.all)
-        all.append(clone.toxml())
-        return LiteralEntity(self.key, raw_val, "".join(all))
+            all = self.inner_white.all + all
+        if self.pre_comment is not None:
+            all = self.pre_comment.all + all
+        return LiteralEntity(self.key, raw_val, all)
 
 
 class NodeMixin:
@@ -269,8 +270,8 @@ class AndroidParser(Parser):
             return XMLJunk(element.toxml())
 
     def handleComment(self, node, root_children, child_num):
-        all = node.toxml()
-        val = normalize(node.nodeValue)
+        all = [node.toxml()]
+        val = [normalize(node.nodeValue)]
         while True:
             child_num += 1
             if child_num >= len(root_children):
@@ -292,8 +293,8 @@ class AndroidParser(Parser):
                     child_num -= 1
                 break
             if white:
-                all += white.toxml()
-                val += normalize(white.nodeValue)
-            all += node.toxml()
-            val += normalize(node.nodeValue)
-        return XMLComment(all, val), child_num
+                all.append(white.toxml())
+                val.append(normalize(white.nodeValue))
+            all.append(node.toxml())
+            val.append(normalize(node.nodeValue))
+        return XMLComment("".join(all), "".join(val)), child_num
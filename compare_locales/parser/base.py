@@ -75,10 +75,10 @@ class Entry:
         return self.ctx.linecol(pos)
 
     def _span_start(self):
-        start = self.span[0]
-        if hasattr(self, "pre_comment") and self.pre_comment is not None:
-            start = self.pre_comment.span[0]
-        return start
+        pre_comment = getattr(self, "pre_comment", None)
+        if pre_comment is not None:
+            return pre_comment.span[0]
+        return self.span[0]
 
     @property
     def all(self):
@@ -103,15 +103,15 @@ class Entry:
     def __repr__(self):
         return self.key
 
-    re_br = re.compile("<br[ \t\r\n]*/?>", re.U)
-    re_sgml = re.compile(r"</?\w+.*?>", re.U | re.M)
+    re_markup = re.compile(r"(?P<br><br[ \t\r\n]*/?>)|</?\w+.*?>", re.U | re.M)
 
     def count_words(self):
         """Count the words in an English string.
         Replace a couple of xml markup to make that safer, too.
         """
-        value = self.re_br.sub("\n", self.val)
-        value = self.re_sgml.sub("", value)
+        value = self.re_markup.sub(
+            lambda m: "\n" if m.group("br") else "", self.val
+        )
         return len(value.split())
 
     def equals(self, other):
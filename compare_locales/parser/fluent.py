@@ -2,8 +2,6 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
-import re
-
 from fluent.syntax import FluentParser as FTLParser
 from fluent.syntax import ast as ftl
 from fluent.syntax.serializer import serialize_comment
@@ -103,6 +101,9 @@ class FluentEntity(Entity):
         return self._word_count
 
     def equals(self, other):
+        # Identical source yields identical ASTs, skip the AST walk then.
+        if self.all == other.all:
+            return True
         return self.entry.equals(other.entry, ignored_fields=self.ignored_fields)
 
     # In Fluent we treat entries as a whole.  FluentChecker reports errors at
@@ -164,6 +165,12 @@ class FluentComment(Comment):
 class FluentParser(Parser):
     capabilities = CAN_SKIP
 
+    # Map exact AST types to Entity classes, the common case in walk.
+    entity_factories = {
+        ftl.Message: FluentMessage,
+        ftl.Term: FluentTerm,
+    }
+
     def __init__(self):
         super().__init__()
         self.ftl_parser = FTLParser()
@@ -182,20 +189,19 @@ class FluentParser(Parser):
                 if entry.span.start > last_span_end:
                     yield Whitespace(self.ctx, (last_span_end, entry.span.start))
 
-            if isinstance(entry, ftl.Message):
-                yield FluentMessage(self.ctx, entry)
-            elif isinstance(entry, ftl.Term):
-                yield FluentTerm(self.ctx, entry)
+            factory = self.entity_factories.get(type(entry))
+            if factory is not None:
+                yield factory(self.ctx, entry)
             elif isinstance(entry, ftl.Junk):
                 start = entry.span.start
                 end = entry.span.end
+                content = entry.content
                 # strip leading whitespace
-                start += re.match("[ \t\r\n]*", entry.content).end()
+                start += len(content) - len(content.lstrip(" \t\r\n"))
                 if not only_localizable and entry.span.start < start:
                     yield Whitespace(self.ctx, (entry.span.start, start))
                 # strip trailing whitespace
-                ws, we = re.search("[ \t\r\n]*$", entry.content).span()
-                end -= we - ws
+                end -= len(content) - len(content.rstrip(" \t\r\n"))
                 yield Junk(self.ctx, (start, end))
                 if not only_localizable and end < entry.span.end:
                     yield Whitespace(self.ctx, (end, entry.span.end))
@@ -35,17 +35,21 @@ class PoEntity(PoEntityMixin, Entity):
     pass
 
 
+# Escape sequences known to gettext string lists
+KNOWN_ESCAPES = {
+    r"\\": "\\",
+    r"\t": "\t",
+    r"\r": "\r",
+    r"\n": "\n",
+    r"\"": '"',
+}
+re_escape = re.compile(r'\\[\\trn"]')
+
+
 # Unescape and concat a string list
 def eval_stringlist(lines):
     return "".join(
-        (
-            line.replace(r"\\", "\\")
-            .replace(r"\t", "\t")
-            .replace(r"\r", "\r")
-            .replace(r"\n", "\n")
-            .replace(r"\"", '"')
-        )
-        for line in lines
+        re_escape.sub(lambda m: KNOWN_ESCAPES[m.group()], line) for line in lines
     )
 
 
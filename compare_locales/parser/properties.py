@@ -15,15 +15,23 @@ class PropertiesEntityMixin:
 
     @property
     def val(self):
+        raw_val = self.raw_val
+        # The escape pattern only matches after a backslash; most values
+        # don't have one, skip the substitution for those.
+        if "\\" not in raw_val:
+            return raw_val
+
         def unescape(m):
-            found = m.groupdict()
-            if found["uni"]:
-                return chr(int(found["uni"][1:], 16))
-            if found["nl"]:
+            # exactly one of the named groups matches
+            uni = m.group("uni")
+            if uni is not None:
+                return chr(int(uni[1:], 16))
+            if m.group("nl") is not None:
                 return ""
-            return self.known_escapes.get(found["single"], found["single"])
+            single = m.group("single")
+            return self.known_escapes.get(single, single)
 
-        return self.escape.sub(unescape, self.raw_val)
+        return self.escape.sub(unescape, raw_val)
 
 
 class PropertiesEntity(PropertiesEntityMixin, Entity):
@@ -33,12 +41,10 @@ class PropertiesEntity(PropertiesEntityMixin, Entity):
 class PropertiesParser(Parser):
     Comment = OffsetComment
 
-    def __init__(self):
-        self.reKey = re.compile("(?P<key>[^#! \t\r\n][^=:\n]*?)[ \t]*[:=][ \t]*", re.M)
-        self.reComment = re.compile("(?:[#!][^\n]*\n)*(?:[#!][^\n]*)", re.M)
-        self._escapedEnd = re.compile(r"\\+$")
-        self._trailingWS = re.compile(r"[ \t\r\n]*(?:\n|\Z)", re.M)
-        Parser.__init__(self)
+    reKey = re.compile("(?P<key>[^#! \t\r\n][^=:\n]*?)[ \t]*[:=][ \t]*", re.M)
+    reComment = re.compile("(?:[#!][^\n]*\n)*(?:[#!][^\n]*)", re.M)
+    _escapedEnd = re.compile(r"\\+$")
+    _trailingWS = re.compile(r"[ \t\r\n]*(?:\n|\Z)", re.M)
 
     def getNext(self, ctx, offset):
         junk_offset = offset
@@ -121,8 +121,8 @@ class L10nConfigParser:
 
     def allLocales(self):
         """Return a list of all the locales of this project"""
-        with open(self.all_path) as f:
-            return util.parseLocales(f.read())
+        with open(self.all_path, "rb") as f:
+            return util.parseLocalesBytes(f.read())
 
 
 class SourceTreeConfigParser(L10nConfigParser):
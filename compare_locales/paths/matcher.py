@@ -5,6 +5,7 @@
 import os
 import re
 import itertools
+from functools import lru_cache
 from compare_locales import mozpath
 
 
@@ -14,6 +15,10 @@ ANDROID_LEGACY_MAP = {"he": "iw", "id": "in", "yi": "ji"}
 ANDROID_STANDARD_MAP = {
     legacy: standard for standard, legacy in ANDROID_LEGACY_MAP.items()
 }
+ANDROID_LEGACY_CODE = re.compile(r"(iw|in|ji)(?=\Z|-)")
+ANDROID_STANDARD_CODE = re.compile(r"(he|id|yi)(?=\Z|-)")
+ANDROID_REGION = re.compile(r"-r([A-Z]{2})")
+LANGUAGE_REGION = re.compile(r"[a-z]{2,3}-[A-Z]{2}")
 
 
 class Matcher:
@@ -29,7 +34,10 @@ class Matcher:
     def __init__(self, pattern_or_other, env={}, root=None, encoding=None):
         """Create regular expression similar to mozpath.match()."""
         parser = PatternParser()
-        real_env = {k: parser.parse(v) for k, v in env.items()}
+        real_env = {
+            k: parse_pattern(v) if isinstance(v, str) else parser.parse(v)
+            for k, v in env.items()
+        }
         self._cached_re = None
         if root is not None:
             # make sure that our root is fully expanded and ends with /
@@ -80,12 +88,11 @@ class Matcher:
             # map android_locale to locale code
             locale = d["android_locale"]
             # map legacy locale codes, he <-> iw, id <-> in, yi <-> ji
-            locale = re.sub(
-                r"(iw|in|ji)(?=\Z|-)",
+            locale = ANDROID_LEGACY_CODE.sub(
                 lambda legacy: ANDROID_STANDARD_MAP[legacy.group(1)],
                 locale,
             )
-            locale = re.sub(r"-r([A-Z]{2})", r"-\1", locale)
+            locale = ANDROID_REGION.sub(r"-\1", locale)
             locale = locale.replace("b+", "").replace("+", "-")
             d["locale"] = locale
         return d
@@ -337,12 +344,11 @@ class AndroidLocale(Variable):
             return None
         android = bcp47 = env["locale"].expand(self._no_cycle(env))
         # map legacy locale codes, he <-> iw, id <-> in, yi <-> ji
-        android = bcp47 = re.sub(
-            r"(he|id|yi)(?=\Z|-)",
+        android = bcp47 = ANDROID_STANDARD_CODE.sub(
             lambda standard: ANDROID_LEGACY_MAP[standard.group(1)],
             bcp47,
         )
-        if re.match(r"[a-z]{2,3}-[A-Z]{2}", bcp47):
+        if LANGUAGE_REGION.match(bcp47):
             android = "{}-r{}".format(*bcp47.split("-"))
         elif "-" in bcp47:
             android = "b+" + bcp47.replace("-", "+")
@@ -452,3 +458,14 @@ class PatternParser:
         else:
             # **
             self.pattern.append(Starstar(wildcard, match.group("suffix")))
+
+
+@lru_cache(maxsize=None)
+def parse_pattern(pattern):
+    """Parse a pattern string into a Pattern, caching the result.
+
+    Environment values like locale codes recur across Matchers, and the
+    parsed Patterns for them are shared read-only, so parse each string
+    only once.
+    """
+    return PatternParser().parse(pattern)
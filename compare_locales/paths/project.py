@@ -29,6 +29,8 @@ class ProjectConfig:
         self.locales = None
         # cache for all_locales, as that's not in `filter`
         self._all_locales = None
+        # set companion to all_locales for O(1) membership tests
+        self._all_locales_set = None
         self.environ = {}
         self.children = []
         self.excludes = []
@@ -130,10 +132,12 @@ class ProjectConfig:
 
     @property
     def configs(self):
-        "Recursively get all configs in this project and its children"
-        yield self
-        for child in self.children:
-            yield from child.configs
+        "Get all configs in this project and its children, depth-first"
+        stack = [self]
+        while stack:
+            config = stack.pop()
+            yield config
+            stack.extend(reversed(config.children))
 
     @property
     def all_locales(self):
@@ -146,13 +150,16 @@ class ProjectConfig:
                 for paths in config.paths:
                     if "locales" in paths:
                         all_locales.update(paths["locales"])
+            self._all_locales_set = frozenset(all_locales)
             self._all_locales = sorted(all_locales)
         return self._all_locales
 
     def filter(self, l10n_file, entity=None):
         """Filter a localization file or entities within, according to
         this configuration file."""
-        if l10n_file.locale not in self.all_locales:
+        if self._all_locales is None:
+            self.all_locales  # build the locale caches
+        if l10n_file.locale not in self._all_locales_set:
             return "ignore"
         if self.filter_py is not None:
             return self.filter_py(l10n_file.module, l10n_file.file, entity=entity)
@@ -215,5 +215,5 @@ def get_plural_rule(locale):
         return None
     if locale in CATEGORIES_BY_LOCALE:
         return CATEGORIES_BY_LOCALE[locale]
-    locale = locale.split("-", 1)[0]
+    locale = locale.partition("-")[0]
     return CATEGORIES_BY_LOCALE.get(locale)
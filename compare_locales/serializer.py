@@ -22,7 +22,6 @@ we also prune whitespace once more.`
 """
 
 from codecs import encode
-from functools import reduce
 
 from compare_locales.merge import merge_resources, serialize_legacy_resource
 from compare_locales.parser import getParser
@@ -105,19 +104,21 @@ def placeholder(entry):
 
 
 def prune_placeholders(entries):
-    pruned = [entry for entry in entries if not isinstance(entry, PlaceholderEntity)]
+    # PlaceholderEntity isn't subclassed, so an exact type check in a local
+    # is all the comprehension needs per entry.
+    placeholder_type = PlaceholderEntity
+    pruned = [entry for entry in entries if type(entry) is not placeholder_type]
 
-    def prune_whitespace(acc, entity):
-        if len(acc) and isinstance(entity, Whitespace):
-            prev_entity = acc[-1]
+    result = []
+    for entity in pruned:
+        if result and isinstance(entity, Whitespace):
+            prev_entity = result[-1]
 
             if isinstance(prev_entity, Whitespace):
                 # Prefer the longer whitespace.
                 if len(entity.all) > len(prev_entity.all):
-                    acc[-1] = entity
-                return acc
+                    result[-1] = entity
+                continue
 
-        acc.append(entity)
-        return acc
-
-    return reduce(prune_whitespace, pruned, [])
+        result.append(entity)
+    return result
@@ -6,33 +6,54 @@
 """
 
 
+from functools import lru_cache
 from itertools import zip_longest
 from pkg_resources import resource_string
-import re
 import unittest
 
 from compare_locales import parser
 from compare_locales.checks import getChecker
 
 
+@lru_cache(maxsize=None)
+def load_resource(name):
+    """Load a test resource from data/, with fake universal line endings.
+
+    Tests read the same files over and over, cache them.
+    """
+    testcontent = resource_string(__name__, "data/" + name)
+    return testcontent.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+
+@lru_cache(maxsize=None)
+def parse_reference(filename, content):
+    """Parse reference content, shared between test classes.
+
+    Several check-test classes run against the same reference content,
+    parse each combination only once.
+    """
+    p = parser.getParser(filename)
+    p.readContents(content)
+    return p.parse()
+
+
 class ParserTestMixin:
     """Utility methods used by the parser tests."""
 
     filename = None
 
-    def setUp(self):
-        """Create a parser for this test."""
-        self.parser = parser.getParser(self.filename)
+    @classmethod
+    def setUpClass(cls):
+        """Create a parser for the tests of this class."""
+        cls.parser = parser.getParser(cls.filename)
 
-    def tearDown(self):
-        "tear down this test"
-        del self.parser
+    @classmethod
+    def tearDownClass(cls):
+        "tear down the tests of this class"
+        del cls.parser
 
     def resource(self, name):
-        testcontent = resource_string(__name__, "data/" + name)
-        # fake universal line endings
-        testcontent = re.sub(b"\r\n?", lambda m: b"\n", testcontent)
-        return testcontent
+        return load_resource(name)
 
     def _test(self, unicode_content, refs):
         """Helper to test the parser.
@@ -58,10 +79,9 @@ class BaseHelper(unittest.TestCase):
     file = None
     refContent = None
 
-    def setUp(self):
-        p = parser.getParser(self.file.file)
-        p.readContents(self.refContent)
-        self.refList = p.parse()
+    @classmethod
+    def setUpClass(cls):
+        cls.refList = parse_reference(cls.file.file, cls.refContent)
 
     def _test(self, content, refWarnOrErrors):
         p = parser.getParser(self.file.file)
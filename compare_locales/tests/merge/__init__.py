@@ -0,0 +1,26 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Mixins for merge tests.
+"""
+
+
+from compare_locales.merge import merge_channels
+
+
+class MergeMixin:
+    """Utility methods used by the merge tests."""
+
+    name = None
+
+    def _test(self, channels, expected):
+        """Helper to test merge_channels.
+
+        Compares the merge result against the expected content,
+        decoded for readable diffs.
+        """
+        self.assertMultiLineEqual(
+            merge_channels(self.name, channels).decode("utf-8"),
+            expected.decode("utf-8"),
+        )
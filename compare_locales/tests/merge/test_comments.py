@@ -3,10 +3,11 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 import unittest
-from compare_locales.merge import merge_channels
 
+from . import MergeMixin
 
-class TestMergeComments(unittest.TestCase):
+
+class TestMergeComments(MergeMixin, unittest.TestCase):
     name = "foo.properties"
 
     def test_comment_added_in_first(self):
@@ -21,9 +22,9 @@ foo = Foo 2
 bar = Bar 2
 """,
         )
-        self.assertMultiLineEqual(
-            merge_channels(self.name, channels).decode("utf-8"),
-            """
+        self._test(
+            channels,
+            b"""
 foo = Foo 1
 # Bar Comment 1
 bar = Bar 1
@@ -42,9 +43,9 @@ foo = Foo 2
 bar = Bar 2
 """,
         )
-        self.assertMultiLineEqual(
-            merge_channels(self.name, channels).decode("utf-8"),
-            """
+        self._test(
+            channels,
+            b"""
 foo = Foo 1
 bar = Bar 1
 """,
@@ -63,9 +64,9 @@ foo = Foo 2
 bar = Bar 2
 """,
         )
-        self.assertMultiLineEqual(
-            merge_channels(self.name, channels).decode("utf-8"),
-            """
+        self._test(
+            channels,
+            b"""
 foo = Foo 1
 # Bar Comment 1
 bar = Bar 1
@@ -73,7 +74,7 @@ bar = Bar 1
         )
 
 
-class TestMergeStandaloneComments(unittest.TestCase):
+class TestMergeStandaloneComments(MergeMixin, unittest.TestCase):
     name = "foo.properties"
 
     def test_comment_added_in_first(self):
@@ -89,9 +90,9 @@ foo = Foo 1
 foo = Foo 2
 """,
         )
-        self.assertMultiLineEqual(
-            merge_channels(self.name, channels).decode("utf-8"),
-            """
+        self._test(
+            channels,
+            b"""
 # Standalone Comment 1
 
 # Foo Comment 1
@@ -112,9 +113,9 @@ foo = Foo 1
 foo = Foo 2
 """,
         )
-        self.assertMultiLineEqual(
-            merge_channels(self.name, channels).decode("utf-8"),
-            """
+        self._test(
+            channels,
+            b"""
 # Standalone Comment 2
 
 # Foo Comment 1
@@ -137,9 +138,9 @@ foo = Foo 1
 foo = Foo 2
 """,
         )
-        self.assertMultiLineEqual(
-            merge_channels(self.name, channels).decode("utf-8"),
-            """
+        self._test(
+            channels,
+            b"""
 # Standalone Comment 2
 
 # Standalone Comment 1
@@ -164,9 +165,9 @@ foo = Foo 1
 foo = Foo 2
 """,
         )
-        self.assertMultiLineEqual(
-            merge_channels(self.name, channels).decode("utf-8"),
-            """
+        self._test(
+            channels,
+            b"""
 # Standalone Comment
 
 # Foo Comment 1
@@ -190,9 +191,9 @@ bar = Bar 1
 bar = Bar 2
 """,
         )
-        self.assertMultiLineEqual(
-            merge_channels(self.name, channels).decode("utf-8"),
-            """
+        self._test(
+            channels,
+            b"""
 # Ambiguous Comment
 
 # Ambiguous Comment
@@ -219,9 +220,9 @@ foo = Foo 1
 bar = Bar 2
 """,
         )
-        self.assertMultiLineEqual(
-            merge_channels(self.name, channels).decode("utf-8"),
-            """
+        self._test(
+            channels,
+            b"""
 # Ambiguous Comment
 foo = Foo 1
 
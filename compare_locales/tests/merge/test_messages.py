@@ -3,58 +3,47 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 import unittest
-from compare_locales.merge import merge_channels
 
+from . import MergeMixin
 
-class TestMergeTwo(unittest.TestCase):
-    name = "foo.properties"
 
-    def test_no_changes(self):
-        channels = (
-            b"""
+# Channel contents shared between tests, so each literal is built once.
+FOO_1 = b"""
 foo = Foo 1
-""",
-            b"""
+"""
+FOO_2 = b"""
 foo = Foo 2
-""",
-        )
-        self.assertEqual(
-            merge_channels(self.name, channels),
-            b"""
+"""
+FOO_3 = b"""
+foo = Foo 3
+"""
+FOO_BAR_1 = b"""
 foo = Foo 1
-""",
-        )
+bar = Bar 1
+"""
+
+
+class TestMergeTwo(MergeMixin, unittest.TestCase):
+    name = "foo.properties"
+
+    def test_no_changes(self):
+        channels = (FOO_1, FOO_2)
+        self._test(channels, FOO_1)
 
     def test_message_added_in_first(self):
-        channels = (
-            b"""
-foo = Foo 1
-bar = Bar 1
-""",
-            b"""
-foo = Foo 2
-""",
-        )
-        self.assertEqual(
-            merge_channels(self.name, channels),
-            b"""
-foo = Foo 1
-bar = Bar 1
-""",
-        )
+        channels = (FOO_BAR_1, FOO_2)
+        self._test(channels, FOO_BAR_1)
 
     def test_message_still_in_last(self):
         channels = (
-            b"""
-foo = Foo 1
-""",
+            FOO_1,
             b"""
 foo = Foo 2
 bar = Bar 2
 """,
         )
-        self.assertEqual(
-            merge_channels(self.name, channels),
+        self._test(
+            channels,
             b"""
 foo = Foo 1
 bar = Bar 2
@@ -63,61 +52,33 @@ bar = Bar 2
 
     def test_message_reordered(self):
         channels = (
-            b"""
-foo = Foo 1
-bar = Bar 1
-""",
+            FOO_BAR_1,
             b"""
 bar = Bar 2
 foo = Foo 2
 """,
         )
-        self.assertEqual(
-            merge_channels(self.name, channels),
-            b"""
-foo = Foo 1
-bar = Bar 1
-""",
-        )
+        self._test(channels, FOO_BAR_1)
 
 
-class TestMergeThree(unittest.TestCase):
+class TestMergeThree(MergeMixin, unittest.TestCase):
     name = "foo.properties"
 
     def test_no_changes(self):
-        channels = (
-            b"""
-foo = Foo 1
-""",
-            b"""
-foo = Foo 2
-""",
-            b"""
-foo = Foo 3
-""",
-        )
-        self.assertEqual(
-            merge_channels(self.name, channels),
-            b"""
-foo = Foo 1
-""",
-        )
+        channels = (FOO_1, FOO_2, FOO_3)
+        self._test(channels, FOO_1)
 
     def test_message_still_in_last(self):
         channels = (
-            b"""
-foo = Foo 1
-""",
-            b"""
-foo = Foo 2
-""",
+            FOO_1,
+            FOO_2,
             b"""
 foo = Foo 3
 bar = Bar 3
 """,
         )
-        self.assertEqual(
-            merge_channels(self.name, channels),
+        self._test(
+            channels,
             b"""
 foo = Foo 1
 bar = Bar 3
@@ -3,10 +3,11 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 import unittest
-from compare_locales.merge import merge_channels
 
+from . import MergeMixin
 
-class TestMergeWhitespace(unittest.TestCase):
+
+class TestMergeWhitespace(MergeMixin, unittest.TestCase):
     name = "foo.properties"
 
     def test_trailing_spaces(self):
@@ -18,8 +19,8 @@ foo = Foo 1
 foo = Foo 2
 """,
         )
-        self.assertEqual(
-            merge_channels(self.name, channels),
+        self._test(
+            channels,
             b"""
 foo = Foo 1
       """,
@@ -37,8 +38,8 @@ foo = Foo 2
 bar = Bar 2
 """,
         )
-        self.assertEqual(
-            merge_channels(self.name, channels),
+        self._test(
+            channels,
             b"""
 foo = Foo 1
 
@@ -55,8 +56,8 @@ foo = Foo 2
 bar = Bar 2
 """,
         )
-        self.assertEqual(
-            merge_channels(self.name, channels),
+        self._test(
+            channels,
             b"""
 foo = Foo 1
 bar = Bar 2
@@ -82,8 +83,8 @@ baz = Baz 2
 
 """,
         )
-        self.assertEqual(
-            merge_channels(self.name, channels),
+        self._test(
+            channels,
             b"""
 
 foo = Foo 1
@@ -216,10 +216,15 @@ foo = value
         )
 
     def test_empty_file(self):
-        self._test("", tuple())
-        self._test("\n", ((Whitespace, "\n"),))
-        self._test("\n\n", ((Whitespace, "\n\n"),))
-        self._test(" \n\n", ((Whitespace, "\n\n"),))
+        cases = (
+            ("", tuple()),
+            ("\n", ((Whitespace, "\n"),)),
+            ("\n\n", ((Whitespace, "\n\n"),)),
+            (" \n\n", ((Whitespace, "\n\n"),)),
+        )
+        for content, refs in cases:
+            with self.subTest(content=content):
+                self._test(content, refs)
 
     def test_positions(self):
         self.parser.readContents(
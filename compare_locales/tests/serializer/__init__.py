@@ -16,10 +16,11 @@ class Helper:
     name = None
     reference_content = None
 
-    def setUp(self):
-        p = self.parser = getParser(self.name)
-        p.readUnicode(self.reference_content)
-        self.reference = list(p.walk())
+    @classmethod
+    def setUpClass(cls):
+        p = cls.parser = getParser(cls.name)
+        p.readUnicode(cls.reference_content)
+        cls.reference = list(p.walk())
 
     def _test(self, old_content, new_data, expected):
         """Test with old content, new data, and the reference data
@@ -42,3 +42,33 @@ de
             ),
             ["af", "de"],
         )
+
+    def test_duplicates(self):
+        self.assertEqual(
+            util.parseLocales(
+                """af
+de
+af"""
+            ),
+            ["af", "de"],
+        )
+
+    def test_unsorted(self):
+        self.assertEqual(
+            util.parseLocales(
+                """de
+af""",
+                sort=False,
+            ),
+            ["de", "af"],
+        )
+
+    def test_bytes(self):
+        self.assertEqual(
+            util.parseLocalesBytes(
+                b"""af
+ja win mac
+de"""
+            ),
+            ["af", "de", "ja"],
+        )
@@ -6,6 +6,33 @@
 # test_util is in compare-locales only, for the sake of easy
 # development.
 
+import re
 
-def parseLocales(content):
-    return sorted(line.split()[0] for line in content.splitlines() if line)
+# first whitespace-separated token of each non-blank line
+first_locale = re.compile(r"^[ \t]*(\S+)", re.M)
+first_locale_bytes = re.compile(rb"^[ \t]*(\S+)", re.M)
+
+
+def parseLocales(content, sort=True):
+    """Return the locales of an all-locales or shipped-locales file.
+
+    Pass sort=False to keep file order; callers that only do membership
+    checks don't need to pay for the sort.
+    """
+    # dict.fromkeys deduplicates while keeping file order
+    locales = list(dict.fromkeys(first_locale.findall(content)))
+    if sort:
+        locales.sort()
+    return locales
+
+
+def parseLocalesBytes(content, sort=True):
+    """Like parseLocales, for file contents that weren't decoded yet.
+
+    Only the locale codes themselves get decoded, not the whole file.
+    """
+    tokens = dict.fromkeys(first_locale_bytes.findall(content))
+    locales = [token.decode("utf-8") for token in tokens]
+    if sort:
+        locales.sort()
+    return locales
@@ -0,0 +1,3 @@
+from .lang import LangParser
+
+__all__ = ["LangParser"]
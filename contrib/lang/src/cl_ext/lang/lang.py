@@ -4,6 +4,7 @@ Parser for the .lang translation format.
 
 import re
 
+from parsimonious.exceptions import ParseError
 from parsimonious.grammar import Grammar
 from parsimonious.nodes import NodeVisitor
 
@@ -142,6 +143,8 @@ def node_text(node):
 
 
 class LangParser(Parser):
+    non_blank = re.compile(r"\S")
+
     def use(self, path):
         if isinstance(path, File):
             path = path.fullpath
@@ -153,6 +156,13 @@ class LangParser(Parser):
             return
         ctx = self.ctx
         contents = ctx.contents
+        # Valid files start with a comment or an entity; fail fast on
+        # anything else without spinning up the full PEG machinery.
+        m = self.non_blank.search(contents)
+        if m is not None and m.group() not in "#;":
+            raise ParseError(
+                contents, m.start(), LangVisitor.grammar["lang_file"]
+            )
         for c in LangVisitor(ctx).parse(contents):
             if not only_localizable or isinstance(c, (LangEntity, Junk)):
                 yield c
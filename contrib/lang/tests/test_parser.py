@@ -3,11 +3,7 @@ from compare_locales import parser
 from parsimonious.exceptions import ParseError
 
 
-class TestLangParser(unittest.TestCase):
-    def test_good(self):
-        p = parser.getParser("foo.lang")
-        p.readUnicode(
-            """\
+GOOD = """\
 # Sample comment
 ;Source String
 Translated String
@@ -20,29 +16,40 @@ Translated Multiple Comments
 ;No Comments or Sources
 Translated No Comments or Sources
 """
-        )
-        msgs = p.parse()
-        self.assertEqual(len(msgs), 3)
-
-    def test_empty_translation(self):
-        p = parser.getParser("foo.lang")
-        p.readUnicode(
-            """\
+
+EMPTY_TRANSLATION = """\
 # Sample comment
 ;Source String
 
 """
-        )
-        msgs = p.parse()
-        self.assertEqual(len(msgs), 1)
-        self.assertIsInstance(msgs[0], parser.Junk)
-
-    def test_bad(self):
-        p = parser.getParser("foo.lang")
-        p.readUnicode(
-            """\
+
+BAD = """\
 just garbage
 """
-        )
-        with self.assertRaises(ParseError):
-            p.parse()
+
+
+class TestLangParser(unittest.TestCase):
+    # name, content, message count (None for parse failures),
+    # expected type of the first message or expected exception
+    cases = (
+        ("good", GOOD, 3, None),
+        ("empty_translation", EMPTY_TRANSLATION, 1, parser.Junk),
+        ("bad", BAD, None, ParseError),
+    )
+
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = parser.getParser("foo.lang")
+
+    def test_parse(self):
+        for name, content, count, expected in self.cases:
+            with self.subTest(name=name):
+                self.parser.readUnicode(content)
+                if count is None:
+                    with self.assertRaises(expected):
+                        self.parser.parse()
+                    continue
+                msgs = self.parser.parse()
+                self.assertEqual(len(msgs), count)
+                if expected is not None:
+                    self.assertIsInstance(msgs[0], expected)